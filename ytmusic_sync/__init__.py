@@ -1,11 +1,29 @@
 """Top-level package for ytmusic_sync."""
 
-from .scanner import scan_music_directory
-from .tracker import UploadTracker
-from .uploader import YouTubeMusicUploader
+from importlib import import_module
 
 __all__ = [
     "scan_music_directory",
     "UploadTracker",
     "YouTubeMusicUploader",
 ]
+
+# Public names are imported on first access so ``import ytmusic_sync`` stays cheap.
+_LAZY_ATTRIBUTES = {
+    "scan_music_directory": ".scanner",
+    "UploadTracker": ".tracker",
+    "YouTubeMusicUploader": ".uploader",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
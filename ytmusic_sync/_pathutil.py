@@ -0,0 +1,31 @@
+"""Path helpers shared by the upload trackers and uploader."""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=8192)
+def resolve_cached(path: str) -> str:
+    """Return the canonical form of *path*, memoised to avoid repeated ``realpath`` syscalls.
+
+    Absolute, already-normalised paths that are not symlinks are returned as-is
+    without a full ``resolve()``. Their parent directories are assumed to be
+    canonical already, which holds for paths produced by the scanner: it
+    resolves its root and does not descend into symlinked directories.
+
+    Paths are resolved once per process, so later symlink changes or working
+    directory changes are not picked up for paths that were already seen.
+    """
+
+    if os.path.isabs(path) and os.path.normpath(path) == path and not os.path.islink(path):
+        return path
+    return str(Path(path).resolve())
+
+
+def path_key(media_path: Path | str) -> str:
+    """Return the tracker key for *media_path* without constructing a ``Path``."""
+
+    return resolve_cached(os.fspath(media_path))
@@ -8,7 +8,7 @@ from pathlib import Path
 
 from .config import CONFIG_FILE, load_config, save_config
 from .scanner import scan_music_directory
-from .tracker import UploadTracker
+from .tracker import open_tracker
 from .uploader import AuthenticationError, YouTubeMusicUploader
 
 
@@ -27,6 +27,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=Path.home() / ".ytmusic-sync" / "uploads.json",
         help="Path to the upload tracker JSON file",
     )
+    parser.add_argument(
+        "--tracker-backend",
+        choices=["json", "sqlite"],
+        default="json",
+        help="Tracker storage. 'sqlite' keeps a .db file next to --tracker and imports its JSON entries once.",
+    )
     parser.add_argument(
         "--headers",
         type=Path,
@@ -74,7 +80,7 @@ def main(argv: list[str] | None = None) -> int:
             Path(app_config.headers_path).expanduser() if app_config.headers_path else None
         )
 
-    tracker = UploadTracker(args.tracker)
+    tracker = open_tracker(args.tracker, args.tracker_backend)
     uploader = YouTubeMusicUploader(tracker, headers_path=headers_path, dry_run=args.dry_run)
 
     try:
@@ -83,6 +89,8 @@ def main(argv: list[str] | None = None) -> int:
     except AuthenticationError as exc:
         logging.error("Authentication failed: %s", exc)
         return 1
+    finally:
+        tracker.flush()
     return 0
 
 
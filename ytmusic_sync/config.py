@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
+from . import _jsonutil
+
 logger = logging.getLogger(__name__)
 
 CONFIG_DIR = Path.home() / ".ytmusic-sync"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
+# Parsed configurations keyed by path, validated against the file's (mtime_ns, size).
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], "AppConfig"]] = {}
+
 
 @dataclass
 class AppConfig:
@@ -30,12 +34,35 @@ def _normalise_headers_path(value: Any) -> str | None:
     return None
 
 
+def clear_cache() -> None:
+    """Forget every configuration cached by :func:`load_config`."""
+
+    _CONFIG_CACHE.clear()
+
+
 def load_config(path: Path | str | None = None) -> AppConfig:
-    """Load the persisted configuration from disk."""
+    """Load the persisted configuration from disk.
+
+    The parsed configuration is cached until the file's modification time or
+    size changes; each call returns an independent copy.
+    """
 
     config_path = Path(path) if path is not None else CONFIG_FILE
     try:
-        raw = config_path.read_text(encoding="utf-8")
+        stat = config_path.stat()
+    except FileNotFoundError:
+        return AppConfig()
+    except OSError as exc:
+        logger.warning("Unable to read configuration from %s: %s", config_path, exc)
+        return AppConfig()
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == signature:
+        return replace(cached[1])
+
+    try:
+        raw = config_path.read_bytes()
     except FileNotFoundError:
         return AppConfig()
     except OSError as exc:
@@ -43,8 +70,8 @@ def load_config(path: Path | str | None = None) -> AppConfig:
         return AppConfig()
 
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        data = _jsonutil.loads(raw)
+    except _jsonutil.JSONDecodeError as exc:
         logger.warning("Invalid JSON in configuration %s: %s", config_path, exc)
         return AppConfig()
 
@@ -52,8 +79,9 @@ def load_config(path: Path | str | None = None) -> AppConfig:
         logger.warning("Configuration file %s must contain a JSON object", config_path)
         return AppConfig()
 
-    headers_path = _normalise_headers_path(data.get("headers_path"))
-    return AppConfig(headers_path=headers_path)
+    config = AppConfig(headers_path=_normalise_headers_path(data.get("headers_path")))
+    _CONFIG_CACHE[config_path] = (signature, config)
+    return replace(config)
 
 
 def save_config(config: AppConfig, path: Path | str | None = None) -> None:
@@ -62,7 +90,8 @@ def save_config(config: AppConfig, path: Path | str | None = None) -> None:
     config_path = Path(path) if path is not None else CONFIG_FILE
     config_path.parent.mkdir(parents=True, exist_ok=True)
     data = {"headers_path": config.headers_path}
-    config_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    config_path.write_bytes(_jsonutil.dumps(data, indent=True))
+    _CONFIG_CACHE.pop(config_path, None)
 
 
-__all__ = ["AppConfig", "CONFIG_DIR", "CONFIG_FILE", "load_config", "save_config"]
+__all__ = ["AppConfig", "CONFIG_DIR", "CONFIG_FILE", "clear_cache", "load_config", "save_config"]
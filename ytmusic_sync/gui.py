@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import os
 import threading
+from collections import deque
 from queue import Queue, Empty
 from pathlib import Path
 from tkinter import (
@@ -21,12 +23,26 @@ from tkinter import (
 from tkinter import ttk
 
 from .config import CONFIG_FILE, AppConfig, load_config, save_config
-from .scanner import MediaFile, scan_music_directory
+from .scanner import MediaFile, scan_music_directory_iter
 from .tracker import UploadTracker
 from .uploader import AuthenticationError, YouTubeMusicUploader
 
 logger = logging.getLogger(__name__)
 
+# Only the most recent activity is kept so long upload runs do not grow the log without bound.
+LOG_MAX_LINES = 2000
+# Number of scanned files sent to the UI thread at a time while a scan is running.
+SCAN_BATCH_SIZE = 500
+# Queue polling interval while events are arriving, and the ceiling it backs off to when idle.
+POLL_ACTIVE_MS = 20
+POLL_IDLE_MAX_MS = 250
+# Uploads are network bound, so a few run at once.
+UPLOAD_CONCURRENCY = 3
+# File rows inserted per step when a folder is opened; the rest sit behind a "Show more" row.
+FOLDER_ROW_WINDOW = 500
+
+_MB_PER_BYTE = 1.0 / (1024 * 1024)
+
 
 class UploadApp:
     """Tkinter application for managing uploads with progress feedback."""
@@ -44,10 +60,24 @@ class UploadApp:
 
         self.media_files: list[MediaFile] = []
         self._tree_items: dict[str, str] = {}
+        # Folder row ids by directory, and the scanned files under each folder row.
+        self._folder_items: dict[str, str] = {}
+        self._folder_media: dict[str, list[MediaFile]] = {}
+        # Number of file rows inserted under each opened folder row.
+        self._folder_shown: dict[str, int] = {}
+        # "Show more" row ids by folder row, for folders with rows not yet inserted.
+        self._folder_more: dict[str, str] = {}
+        # Statuses reported for files whose folder has not been expanded yet.
+        self._status_overrides: dict[str, str] = {}
+        self._scan_root: Path | None = None
+        # Keys of scanned files known to be uploaded; avoids asking the tracker per row and per refresh.
+        self._uploaded_keys: set[str] = set()
+        self._log_buffer: deque[str] = deque(maxlen=LOG_MAX_LINES)
+        self._log_flush_pending = False
 
         self.tracker = UploadTracker(Path.home() / ".ytmusic-sync" / "uploads.json")
         # Dry-run default keeps the Windows binary safe until headers are configured.
-        self.uploader = YouTubeMusicUploader(self.tracker, dry_run=True)
+        self.uploader = YouTubeMusicUploader(self.tracker, dry_run=True, max_workers=UPLOAD_CONCURRENCY)
         self.config_path = CONFIG_FILE
         self.app_config: AppConfig = load_config(self.config_path)
 
@@ -55,6 +85,8 @@ class UploadApp:
         self._upload_thread: threading.Thread | None = None
         self._scan_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
+        self._closing = False
+        self._idle_polls = 0
 
         self._build_ui()
         if self.app_config.headers_path:
@@ -118,11 +150,13 @@ class UploadApp:
         list_frame.rowconfigure(0, weight=1)
 
         columns = ("name", "type", "size", "status")
-        self.tree = ttk.Treeview(list_frame, columns=columns, show="headings", selectmode="browse")
+        self.tree = ttk.Treeview(list_frame, columns=columns, show="tree headings", selectmode="browse")
+        self.tree.heading("#0", text="Folder")
         self.tree.heading("name", text="File")
         self.tree.heading("type", text="Type")
         self.tree.heading("size", text="Size (MB)")
         self.tree.heading("status", text="Status")
+        self.tree.column("#0", width=200, anchor="w")
         self.tree.column("name", width=200, anchor="w")
         self.tree.column("type", width=120, anchor="w")
         self.tree.column("size", width=100, anchor="center")
@@ -130,6 +164,8 @@ class UploadApp:
 
         tree_scroll = ttk.Scrollbar(list_frame, orient="vertical", command=self.tree.yview)
         self.tree.configure(yscrollcommand=tree_scroll.set)
+        self.tree.bind("<<TreeviewOpen>>", self._on_tree_open)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
         self.tree.grid(row=0, column=0, sticky=NSEW)
         tree_scroll.grid(row=0, column=1, sticky="ns")
 
@@ -164,6 +200,8 @@ class UploadApp:
         self.status_var.set(f"Scanning {folder}...")
         self._append_log(f"Scanning folder: {folder}")
         self._set_buttons_state(scanning=True)
+        self._clear_tree()
+        self._scan_root = Path(folder).expanduser().resolve()
 
         self._scan_thread = threading.Thread(target=self._scan_worker, args=(Path(folder),), daemon=True)
         self._scan_thread.start()
@@ -173,7 +211,8 @@ class UploadApp:
             messagebox.showinfo("Upload", "No files to upload. Scan a folder first.")
             return
 
-        pending = [media for media in self.media_files if not self.tracker.is_uploaded(media.path)]
+        uploaded_keys = self._uploaded_keys
+        pending = [media for media in self.media_files if media.key not in uploaded_keys]
         if not pending:
             messagebox.showinfo("Upload", "All files in this folder are already uploaded.")
             return
@@ -195,8 +234,13 @@ class UploadApp:
     # Worker threads
     # ------------------------------------------------------------------
     def _scan_worker(self, folder: Path) -> None:
+        batch: list[MediaFile] = []
         try:
-            media_files = scan_music_directory(folder)
+            for media in scan_music_directory_iter(folder):
+                batch.append(media)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    self._progress_queue.put(("scan_batch", batch))
+                    batch = []
         except FileNotFoundError as exc:
             self._progress_queue.put(("scan_error", str(exc)))
             return
@@ -205,63 +249,110 @@ class UploadApp:
             self._progress_queue.put(("scan_error", str(exc)))
             return
 
-        self._progress_queue.put(("scan_complete", folder, media_files))
+        if batch:
+            self._progress_queue.put(("scan_batch", batch))
+        self._progress_queue.put(("scan_complete", folder))
 
     def _upload_worker(self, pending: list[MediaFile]) -> None:
         total = len(pending)
         self._progress_queue.put(("upload_start", total))
-        for index, media in enumerate(pending, start=1):
-            if self._stop_event.is_set():
-                self._progress_queue.put(("upload_cancelled", index - 1, total))
-                break
+        try:
+            completed, auth_failed = self._upload_batch(pending)
+        finally:
+            # Persist any batched tracker updates once the batch ends.
+            self.tracker.flush()
 
-            try:
-                video_id = self.uploader.upload_file(media.path)
-            except AuthenticationError as exc:
-                logger.error("Authentication failed during upload: %s", exc)
-                self._progress_queue.put(("auth_error", str(exc)))
-                break
-            except Exception as exc:  # noqa: BLE001 - log unexpected upload failures
-                logger.exception("Failed to upload %s", media.path)
-                self._progress_queue.put(("upload_error", media.path, str(exc), index, total))
-                continue
+        if auth_failed:
+            return
+        if completed < total:
+            self._progress_queue.put(("upload_cancelled", completed, total))
+            self._progress_queue.put(("upload_stopped",))
+            return
+        self._progress_queue.put(("upload_complete", total))
 
-            if video_id:
-                self.tracker.mark_uploaded(media.path, video_id)
-                self._progress_queue.put(("upload_progress", media.path, index, total))
-            else:
-                self._progress_queue.put(("upload_error", media.path, "No video ID returned", index, total))
+    def _upload_batch(self, pending: list[MediaFile]) -> tuple[int, bool]:
+        """Upload *pending*, returning (completed count, auth failed)."""
 
-        else:
-            self._progress_queue.put(("upload_complete", total))
-            return
+        total = len(pending)
+        completed = 0
 
-        if self._stop_event.is_set():
-            self._progress_queue.put(("upload_stopped",))
+        def report(media: MediaFile, video_id: str | None, error: BaseException | None) -> None:
+            nonlocal completed
+            completed += 1
+            if isinstance(error, AuthenticationError):
+                return
+            if error is not None:
+                self._progress_queue.put(("upload_error", media, str(error), completed, total))
+            elif video_id:
+                self._progress_queue.put(("upload_progress", media, completed, total))
+            else:
+                self._progress_queue.put(("upload_error", media, "No video ID returned", completed, total))
+
+        try:
+            self.uploader.upload_files(pending, stop_event=self._stop_event, on_result=report)
+        except AuthenticationError as exc:
+            logger.error("Authentication failed during upload: %s", exc)
+            self._progress_queue.put(("auth_error", str(exc)))
+            return completed, True
+        return completed, False
 
     # ------------------------------------------------------------------
     # Queue polling and UI updates
     # ------------------------------------------------------------------
     def _poll_queue(self) -> None:
+        events: list[tuple] = []
         try:
             while True:
-                event = self._progress_queue.get_nowait()
-                self._handle_event(event)
+                events.append(self._progress_queue.get_nowait())
         except Empty:
             pass
+        try:
+            self._handle_events(events)
         finally:
-            self.root.after(100, self._poll_queue)
+            # Poll quickly while workers are reporting and back off when idle.
+            if events:
+                self._idle_polls = 0
+                delay = POLL_ACTIVE_MS
+            else:
+                self._idle_polls += 1
+                delay = min(POLL_IDLE_MAX_MS, 50 * self._idle_polls)
+            self.root.after(delay, self._poll_queue)
+
+    def _handle_events(self, events: list[tuple]) -> None:
+        # Consecutive per-file upload events are applied as one batch so the
+        # progress widgets and the log are only updated once per poll.
+        upload_batch: list[tuple] = []
+        for event in events:
+            if event[0] in ("upload_progress", "upload_error"):
+                upload_batch.append(event)
+                continue
+            if upload_batch:
+                self._handle_upload_events(upload_batch)
+                upload_batch = []
+            self._handle_event(event)
+        if upload_batch:
+            self._handle_upload_events(upload_batch)
 
     def _handle_event(self, event: tuple) -> None:
         event_type = event[0]
-        if event_type == "scan_complete":
-            _, folder, media_files = event
-            self.media_files = media_files
-            self._populate_tree()
-            pending_count = len([m for m in media_files if not self.tracker.is_uploaded(m.path)])
-            uploaded_count = len(media_files) - pending_count
+        if event_type == "scan_batch":
+            _, media_files = event
+            self.media_files.extend(media_files)
+            is_uploaded = self.tracker.is_uploaded
+            self._uploaded_keys.update(m.key for m in media_files if is_uploaded(m.path))
+            self._append_tree_rows(media_files)
+            self.status_var.set(f"Scanning... {len(self.media_files)} files found")
+
+        elif event_type == "scan_complete":
+            if len(self._folder_items) == 1:
+                (folder_id,) = self._folder_items.values()
+                self._expand_folder(folder_id)
+                self.tree.item(folder_id, open=True)
+            media_count = len(self.media_files)
+            uploaded_count = len(self._uploaded_keys)
+            pending_count = media_count - uploaded_count
             self.status_var.set(
-                f"Found {len(media_files)} files – {pending_count} pending, {uploaded_count} uploaded"
+                f"Found {media_count} files – {pending_count} pending, {uploaded_count} uploaded"
             )
             self.progressbar.stop()
             self.progressbar.configure(value=0)
@@ -282,23 +373,8 @@ class UploadApp:
             self.progress_var.set(f"0 / {total}")
             self._append_log("Upload started")
 
-        elif event_type == "upload_progress":
-            _, media_path, index, total = event
-            percent = int((index / total) * 100)
-            self.progressbar.configure(value=percent)
-            self.progress_var.set(f"{index} / {total}")
-            self.status_var.set(f"Uploaded {Path(media_path).name}")
-            self._update_tree_status(media_path, "Uploaded")
-            self._append_log(f"Uploaded: {media_path}")
-
-        elif event_type == "upload_error":
-            _, media_path, message, index, total = event
-            percent = int(((index - 1) / total) * 100)
-            self.progressbar.configure(value=percent)
-            self.progress_var.set(f"{index - 1} / {total}")
-            self._update_tree_status(media_path, "Failed")
-            self.status_var.set(f"Failed: {Path(media_path).name}")
-            self._append_log(f"Failed to upload {media_path}: {message}")
+        elif event_type in ("upload_progress", "upload_error"):
+            self._handle_upload_events([event])
 
         elif event_type == "auth_error":
             _, message = event
@@ -334,30 +410,147 @@ class UploadApp:
             self.progress_var.set("Cancelled")
             self._set_buttons_state(idle=True)
 
+    def _handle_upload_events(self, events: list[tuple]) -> None:
+        log_lines = []
+        for event in events:
+            if event[0] == "upload_progress":
+                _, media, index, total = event
+                self._uploaded_keys.add(media.key)
+                self._update_tree_status(media, "Uploaded")
+                log_lines.append(f"Uploaded: {media.path}")
+            else:
+                _, media, message, index, total = event
+                self._update_tree_status(media, "Failed")
+                log_lines.append(f"Failed to upload {media.path}: {message}")
+
+        if events[-1][0] == "upload_progress":
+            done = index
+            self.status_var.set(f"Uploaded {os.path.basename(media.path)}")
+        else:
+            done = index - 1
+            self.status_var.set(f"Failed: {os.path.basename(media.path)}")
+        self.progressbar.configure(value=int((done / total) * 100))
+        self.progress_var.set(f"{done} / {total}")
+        self._append_log("\n".join(log_lines))
+
     # ------------------------------------------------------------------
     # UI helper methods
     # ------------------------------------------------------------------
-    def _populate_tree(self) -> None:
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _clear_tree(self) -> None:
+        self.tree.delete(*self.tree.get_children())
+        self.media_files = []
         self._tree_items.clear()
+        self._folder_items.clear()
+        self._folder_media.clear()
+        self._folder_shown.clear()
+        self._folder_more.clear()
+        self._status_overrides.clear()
+        self._uploaded_keys = set()
+
+    def _append_tree_rows(self, media_files: list[MediaFile]) -> None:
+        """Add newly scanned files to the tree without rebuilding existing rows.
+
+        File rows are only inserted once their folder is opened; until then a
+        folder is represented by a single row with a placeholder child. Opened
+        folders show at most :data:`FOLDER_ROW_WINDOW` rows at a time.
+        """
+
+        folders: dict[str, list[MediaFile]] = {}
+        for media in media_files:
+            folders.setdefault(os.path.dirname(media.path), []).append(media)
+
+        insert = self.tree.insert
+        for folder, new_media in folders.items():
+            folder_id = self._folder_items.get(folder)
+            if folder_id is None:
+                folder_id = insert("", END, text=self._folder_label(folder), values=("", "", "", ""))
+                insert(folder_id, END, text="Loading...")  # placeholder so the folder can be opened
+                self._folder_items[folder] = folder_id
+                self._folder_media[folder_id] = []
+            folder_media = self._folder_media[folder_id]
+            folder_media.extend(new_media)
+            self.tree.set(folder_id, "status", f"{len(folder_media)} file(s)")
+            shown = self._folder_shown.get(folder_id)
+            if shown is not None:
+                self._fill_folder(folder_id, max(shown, FOLDER_ROW_WINDOW))
+
+    def _folder_label(self, folder: str) -> str:
+        if self._scan_root is None:
+            return folder
+        relative = os.path.relpath(folder, self._scan_root)
+        return os.path.basename(folder) if relative == os.curdir else relative
+
+    def _on_tree_open(self, _event: object = None) -> None:
+        self._expand_folder(self.tree.focus())
+
+    def _on_tree_select(self, _event: object = None) -> None:
+        for item_id in self.tree.selection():
+            folder_id = self.tree.parent(item_id)
+            if self._folder_more.get(folder_id) == item_id:
+                self._fill_folder(folder_id, self._folder_shown[folder_id] + FOLDER_ROW_WINDOW)
+
+    def _expand_folder(self, folder_id: str) -> None:
+        if folder_id not in self._folder_media or folder_id in self._folder_shown:
+            return
+        self._folder_shown[folder_id] = 0
+        self.tree.delete(*self.tree.get_children(folder_id))
+        self._fill_folder(folder_id, FOLDER_ROW_WINDOW)
+
+    def _fill_folder(self, folder_id: str, limit: int) -> None:
+        """Insert file rows under *folder_id* until *limit* rows are shown."""
+
+        folder_media = self._folder_media[folder_id]
+        shown = self._folder_shown[folder_id]
+        more_id = self._folder_more.pop(folder_id, None)
+        if more_id is not None:
+            self.tree.delete(more_id)
+        if limit > shown:
+            self._insert_file_rows(folder_id, folder_media[shown:limit])
+            shown = self._folder_shown[folder_id] = min(limit, len(folder_media))
+        remaining = len(folder_media) - shown
+        if remaining:
+            self._folder_more[folder_id] = self.tree.insert(
+                folder_id, END, text=f"Show more ({remaining} remaining)..."
+            )
+
+    def _insert_file_rows(self, folder_id: str, media_files: list[MediaFile]) -> None:
+        uploaded_keys = self._uploaded_keys
+        overrides = self._status_overrides
+        basename = os.path.basename
+        rows = [
+            (
+                basename(media.path),
+                media.mime_type,
+                f"{media.size_bytes * _MB_PER_BYTE:.2f}",
+                overrides.pop(media.key, None) or ("Uploaded" if media.key in uploaded_keys else "Pending"),
+            )
+            for media in media_files
+        ]
 
-        for media in self.media_files:
-            status = "Uploaded" if self.tracker.is_uploaded(media.path) else "Pending"
-            size_mb = f"{media.size_bytes / (1024 * 1024):.2f}"
-            values = (media.path.name, media.mime_type, size_mb, status)
-            item_id = self.tree.insert("", END, values=values)
-            self._tree_items[str(Path(media.path).resolve())] = item_id
+        insert = self.tree.insert
+        tree_items = self._tree_items
+        for media, values in zip(media_files, rows):
+            tree_items[media.key] = insert(folder_id, END, values=values)
 
-    def _update_tree_status(self, media_path: Path | str, status: str) -> None:
-        resolved = str(Path(media_path).resolve())
-        item_id = self._tree_items.get(resolved)
+    def _update_tree_status(self, media: MediaFile, status: str) -> None:
+        key = media.key
+        item_id = self._tree_items.get(key)
         if item_id:
             self.tree.set(item_id, "status", status)
+        else:
+            self._status_overrides[key] = status
 
     def _append_log(self, message: str) -> None:
+        self._log_buffer.extend(f"{line}\n" for line in message.split("\n"))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self) -> None:
+        self._log_flush_pending = False
         self.log_text.configure(state=NORMAL)
-        self.log_text.insert(END, f"{message}\n")
+        self.log_text.delete("1.0", END)
+        self.log_text.insert(END, "".join(self._log_buffer))
         self.log_text.see(END)
         self.log_text.configure(state=DISABLED)
 
@@ -395,10 +588,23 @@ class UploadApp:
                 )
 
     def _on_close(self) -> None:
+        if self._closing:
+            return
         if self._upload_thread and self._upload_thread.is_alive():
             if not messagebox.askyesno("Quit", "Uploads are running. Do you really want to exit?"):
                 return
             self._stop_event.set()
+            self._closing = True
+            self._append_log("Waiting for running uploads to finish before exiting...")
+        self._close_when_idle()
+
+    def _close_when_idle(self) -> None:
+        # The upload thread is a daemon, so destroying the window early would kill it
+        # before it records the uploads still in flight and flushes the tracker.
+        if self._upload_thread and self._upload_thread.is_alive():
+            self.root.after(POLL_IDLE_MAX_MS, self._close_when_idle)
+            return
+        self.tracker.flush()
         self.root.destroy()
 
     # ------------------------------------------------------------------
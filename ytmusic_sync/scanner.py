@@ -5,47 +5,107 @@ from __future__ import annotations
 import logging
 import mimetypes
 import os
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterator, List, Tuple
 
 logger = logging.getLogger(__name__)
 
 SUPPORTED_MIME_PREFIXES = {"audio", "video"}
 
+mimetypes.init()
+# Lower-case extension (including the leading dot) -> mime type, restricted to
+# supported media so the scan loop only needs a single dict lookup per file.
+_MEDIA_TYPES_BY_EXTENSION = {
+    extension.lower(): mime_type
+    for extension, mime_type in mimetypes.types_map.items()
+    if mime_type.split("/", 1)[0] in SUPPORTED_MIME_PREFIXES
+}
 
-@dataclass
+# Directory listing is dominated by syscall latency, which releases the GIL,
+# so sibling directories are listed concurrently.
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+@dataclass(frozen=True, slots=True)
 class MediaFile:
     """Representation of a media file discovered by :func:`scan_music_directory`."""
 
-    path: Path
+    path: str
     size_bytes: int
     mime_type: str
+    #: Absolute path string used to identify the file, computed without touching the filesystem.
+    key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "key", os.path.abspath(self.path))
 
     def to_dict(self) -> dict:
         return {
-            "path": str(self.path),
+            "path": os.fspath(self.path),
             "size_bytes": self.size_bytes,
             "mime_type": self.mime_type,
         }
 
 
-def _iter_media_files(root: Path) -> Iterable[Path]:
-    for current_path, _, files in os.walk(root):
-        for file_name in files:
-            file_path = Path(current_path, file_name)
-            mime_type, _ = mimetypes.guess_type(file_path)
-            if mime_type is None:
-                logger.debug("Skipping %s; unable to determine mime type", file_path)
-                continue
-            if mime_type.split("/", 1)[0] not in SUPPORTED_MIME_PREFIXES:
-                logger.debug("Skipping %s; unsupported mime type %s", file_path, mime_type)
-                continue
-            yield file_path
-
-
-def scan_music_directory(path: Path | str) -> List[MediaFile]:
-    """Scan *path* for media files.
+def _scan_directory(directory: str) -> Tuple[List[Tuple[str, int, str]], List[str]]:
+    """List *directory* once, returning its media files and subdirectories."""
+
+    files: List[Tuple[str, int, str]] = []
+    subdirectories: List[str] = []
+    # Bound to locals to avoid repeated attribute and global lookups in the per-entry loop.
+    add_file = files.append
+    add_subdirectory = subdirectories.append
+    media_type_for = _MEDIA_TYPES_BY_EXTENSION.get
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    add_subdirectory(entry.path)
+                    continue
+                # Filter on the name before is_file(), which may need a stat for
+                # symlinks or on filesystems that do not report entry types.
+                name = entry.name
+                dot = name.rfind(".")
+                mime_type = media_type_for(name[dot:].lower()) if dot >= 0 else None
+                if mime_type is None:
+                    logger.debug("Skipping %s; unsupported file type", entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+                try:
+                    # Served from the directory listing on Windows; cached on the entry elsewhere.
+                    size = entry.stat().st_size
+                except OSError as exc:
+                    logger.warning("Unable to stat %s: %s", entry.path, exc)
+                    continue
+                add_file((entry.path, size, mime_type))
+    except OSError as exc:
+        logger.warning("Unable to read directory %s: %s", directory, exc)
+    return files, subdirectories
+
+
+def _iter_media_files(root: Path) -> Iterator[Tuple[str, int, str]]:
+    """Yield ``(path, size_bytes, mime_type)`` for every media file below *root*."""
+
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+        pending = {executor.submit(_scan_directory, os.fspath(root))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirectories = future.result()
+                pending.update(executor.submit(_scan_directory, subdirectory) for subdirectory in subdirectories)
+                yield from files
+
+
+def scan_music_directory_iter(path: Path | str) -> Iterator[MediaFile]:
+    """Lazily scan *path* for media files.
+
+    Unlike :func:`scan_music_directory`, files are yielded as soon as their
+    directory has been listed, so callers can show results while the scan is
+    still running. A missing directory is reported immediately rather than on
+    the first iteration.
 
     Parameters
     ----------
@@ -54,7 +114,7 @@ def scan_music_directory(path: Path | str) -> List[MediaFile]:
 
     Returns
     -------
-    list of :class:`MediaFile`
+    iterator of :class:`MediaFile`
         Discovered media files with metadata.
     """
 
@@ -63,16 +123,32 @@ def scan_music_directory(path: Path | str) -> List[MediaFile]:
         raise FileNotFoundError(f"Music directory '{root}' does not exist or is not a directory")
 
     logger.info("Scanning directory %s for media files", root)
-    media_files = []
-    for file_path in _iter_media_files(root):
-        size = file_path.stat().st_size
-        mime_type, _ = mimetypes.guess_type(file_path)
-        assert mime_type is not None  # guarded above
-        media_files.append(MediaFile(path=file_path, size_bytes=size, mime_type=mime_type))
+    return _iter_scan(root)
+
+
+def _iter_scan(root: Path) -> Iterator[MediaFile]:
+    for file_path, size, mime_type in _iter_media_files(root):
         logger.debug("Discovered %s (%s, %d bytes)", file_path, mime_type, size)
+        yield MediaFile(file_path, size, mime_type)
+
+
+def scan_music_directory(path: Path | str) -> List[MediaFile]:
+    """Scan *path* for media files.
+
+    Parameters
+    ----------
+    path:
+        Directory to recursively scan for media files.
+
+    Returns
+    -------
+    list of :class:`MediaFile`
+        Discovered media files with metadata.
+    """
 
-    logger.info("Discovered %d media files in %s", len(media_files), root)
+    media_files = list(scan_music_directory_iter(path))
+    logger.info("Discovered %d media files in %s", len(media_files), path)
     return media_files
 
 
-__all__ = ["MediaFile", "scan_music_directory"]
+__all__ = ["MediaFile", "scan_music_directory", "scan_music_directory_iter"]
@@ -26,3 +26,23 @@ def test_load_config_ignores_invalid_json(tmp_path: Path) -> None:
 
     config = load_config(config_path)
     assert config.headers_path is None
+
+
+def test_load_config_ignores_malformed_json(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    config_path.write_text("{not json", encoding="utf-8")
+
+    config = load_config(config_path)
+    assert config.headers_path is None
+
+
+def test_load_config_cache_tracks_file_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    save_config(AppConfig(headers_path="first.json"), config_path)
+
+    loaded = load_config(config_path)
+    loaded.headers_path = "mutated.json"
+    assert load_config(config_path).headers_path == "first.json"
+
+    config_path.write_text('{"headers_path": "second-file.json"}', encoding="utf-8")
+    assert load_config(config_path).headers_path == "second-file.json"
@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from ytmusic_sync.scanner import MediaFile, scan_music_directory
+from ytmusic_sync.scanner import MediaFile, scan_music_directory, scan_music_directory_iter
 
 
 def create_file(path: Path, content: bytes = b"data") -> None:
@@ -20,10 +20,59 @@ def test_scan_music_directory_filters_supported_types(tmp_path: Path) -> None:
     results = scan_music_directory(tmp_path)
     assert len(results) == 2
     assert all(isinstance(item, MediaFile) for item in results)
-    assert {item.path.name for item in results} == {"song.mp3", "video.mp4"}
+    assert {Path(item.path).name for item in results} == {"song.mp3", "video.mp4"}
 
 
 def test_scan_music_directory_missing_dir(tmp_path: Path) -> None:
     missing = tmp_path / "missing"
     with pytest.raises(FileNotFoundError):
         scan_music_directory(missing)
+
+
+def test_scan_music_directory_recurses_into_subdirectories(tmp_path: Path) -> None:
+    nested = tmp_path / "artist" / "album"
+    nested.mkdir(parents=True)
+    create_file(tmp_path / "single.flac")
+    create_file(nested / "track.mp3", b"12345")
+
+    results = {Path(item.path).name: item for item in scan_music_directory(tmp_path)}
+    assert set(results) == {"single.flac", "track.mp3"}
+    assert results["track.mp3"].size_bytes == 5
+    assert results["track.mp3"].path == str(nested / "track.mp3")
+
+
+def test_scan_music_directory_matches_extensions_case_insensitively(tmp_path: Path) -> None:
+    create_file(tmp_path / "LOUD.MP3")
+    create_file(tmp_path / "no_extension")
+
+    results = scan_music_directory(tmp_path)
+    assert [(Path(item.path).name, item.mime_type) for item in results] == [("LOUD.MP3", "audio/mpeg")]
+
+
+def test_scan_music_directory_iter_yields_media_and_fails_early(tmp_path: Path) -> None:
+    create_file(tmp_path / "song.ogg")
+
+    assert [Path(item.path).name for item in scan_music_directory_iter(tmp_path)] == ["song.ogg"]
+    with pytest.raises(FileNotFoundError):
+        scan_music_directory_iter(tmp_path / "missing")
+
+
+def test_media_file_key_is_absolute_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    media = MediaFile(path="song.mp3", size_bytes=1, mime_type="audio/mpeg")
+    assert media.key == str(tmp_path / "song.mp3")
+
+
+def test_scan_music_directory_does_not_follow_directory_symlinks(tmp_path: Path) -> None:
+    library = tmp_path / "library"
+    outside = tmp_path / "outside"
+    library.mkdir()
+    outside.mkdir()
+    create_file(library / "song.mp3")
+    create_file(outside / "elsewhere.mp3")
+    try:
+        (library / "linked").symlink_to(outside, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not supported on this platform")
+
+    assert [Path(item.path).name for item in scan_music_directory(library)] == ["song.mp3"]
@@ -1,7 +1,14 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 from ytmusic_sync.scanner import MediaFile
-from ytmusic_sync.tracker import UploadTracker
+from ytmusic_sync.tracker import SQLiteUploadTracker, UploadTracker
 
 
 def test_tracker_marks_and_checks(tmp_path: Path) -> None:
@@ -26,3 +33,196 @@ def test_pending_items(tmp_path: Path) -> None:
 
     pending = tracker.pending_items([media_a, media_b])
     assert list(pending.keys()) == [str(media_b.path.resolve())]
+
+
+def test_autosave_batches_writes_until_flush(tmp_path: Path) -> None:
+    tracker_file = tmp_path / "uploads.json"
+    tracker = UploadTracker(tracker_file, flush_every=3)
+
+    tracker.mark_uploaded(tmp_path / "a.mp3", "video-a")
+    tracker.mark_uploaded(tmp_path / "b.mp3", "video-b")
+    assert not UploadTracker(tracker_file).is_uploaded(tmp_path / "a.mp3")
+
+    tracker.mark_uploaded(tmp_path / "c.mp3", "video-c")
+    assert UploadTracker(tracker_file).is_uploaded(tmp_path / "c.mp3")
+
+    with tracker:
+        tracker.mark_uploaded(tmp_path / "d.mp3", "video-d")
+    assert UploadTracker(tracker_file).get_video_id(tmp_path / "d.mp3") == "video-d"
+
+
+def test_tracker_resolves_relative_and_symlinked_paths(tmp_path: Path, monkeypatch) -> None:
+    tracker = UploadTracker(tmp_path / "uploads.json")
+    target = tmp_path / "song.mp3"
+    target.write_bytes(b"data")
+    tracker.mark_uploaded(target, "video123")
+
+    monkeypatch.chdir(tmp_path)
+    assert tracker.is_uploaded("./sub/../song.mp3")
+    link = tmp_path / "link.mp3"
+    try:
+        link.symlink_to(target)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not supported on this platform")
+    assert tracker.get_video_id(link) == "video123"
+
+
+def test_sqlite_tracker_imports_json_and_persists(tmp_path: Path) -> None:
+    tracker_file = tmp_path / "uploads.json"
+    json_tracker = UploadTracker(tracker_file)
+    json_tracker.mark_uploaded(tmp_path / "old.mp3", "video-old")
+    json_tracker.flush()
+
+    with SQLiteUploadTracker(tracker_file) as tracker:
+        assert tracker.get_video_id(tmp_path / "old.mp3") == "video-old"
+        tracker.mark_uploaded(tmp_path / "new.mp3", "video-new")
+        media = [
+            MediaFile(path=str(tmp_path / name), size_bytes=1, mime_type="audio/mpeg")
+            for name in ("old.mp3", "new.mp3", "pending.mp3")
+        ]
+        assert list(tracker.pending_items(media)) == [str(tmp_path / "pending.mp3")]
+
+    with SQLiteUploadTracker(tracker_file) as reopened:
+        assert reopened.is_uploaded(tmp_path / "new.mp3")
+
+
+
+def test_interrupted_sqlite_import_is_retried(tmp_path: Path, monkeypatch) -> None:
+    tracker_file = tmp_path / "uploads.json"
+    json_tracker = UploadTracker(tracker_file)
+    for index in range(10):
+        json_tracker.mark_uploaded(tmp_path / f"song{index}.mp3", f"video-{index}")
+    json_tracker.flush()
+
+    class InterruptedConnection:
+        """Connection wrapper whose bulk insert dies after writing a few rows."""
+
+        def __init__(self, connection: sqlite3.Connection) -> None:
+            self._connection = connection
+
+        def __getattr__(self, name: str):
+            return getattr(self._connection, name)
+
+        def executemany(self, sql: str, rows):
+            for row in list(rows)[:3]:
+                self._connection.execute(sql, row)
+            raise sqlite3.OperationalError("disk I/O error")
+
+    connect = sqlite3.connect
+    monkeypatch.setattr(sqlite3, "connect", lambda *args, **kwargs: InterruptedConnection(connect(*args, **kwargs)))
+    with pytest.raises(sqlite3.OperationalError):
+        SQLiteUploadTracker(tracker_file)
+    monkeypatch.undo()
+
+    with SQLiteUploadTracker(tracker_file) as tracker:
+        assert all(tracker.is_uploaded(tmp_path / f"song{index}.mp3") for index in range(10))
+
+
+def test_save_replaces_tracker_file_without_leftovers(tmp_path: Path) -> None:
+    tracker_file = tmp_path / "uploads.json"
+    tracker = UploadTracker(tracker_file)
+    tracker.mark_uploaded(tmp_path / "song.mp3", "video123")
+    tracker.save()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["uploads.json"]
+    assert UploadTracker(tracker_file).is_uploaded(tmp_path / "song.mp3")
+
+
+
+def test_failed_save_keeps_tracker_and_removes_temporary_file(tmp_path: Path, monkeypatch) -> None:
+    tracker_file = tmp_path / "uploads.json"
+    tracker = UploadTracker(tracker_file)
+    tracker.mark_uploaded(tmp_path / "old.mp3", "video-old")
+    tracker.save()
+
+    def fail(fd: int) -> None:
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(os, "fsync", fail)
+    tracker.mark_uploaded(tmp_path / "new.mp3", "video-new")
+    with pytest.raises(OSError):
+        tracker.save()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["uploads.json"]
+    assert UploadTracker(tracker_file).is_uploaded(tmp_path / "old.mp3")
+
+
+def test_tracker_migrates_legacy_nested_format(tmp_path: Path) -> None:
+    tracker_file = tmp_path / "uploads.json"
+    song = str(tmp_path / "song.mp3")
+    tracker_file.write_text(json.dumps({song: {"video_id": "video123"}}), encoding="utf-8")
+
+    tracker = UploadTracker(tracker_file)
+    assert tracker.get_video_id(song) == "video123"
+
+    tracker.save()
+    assert json.loads(tracker_file.read_text(encoding="utf-8")) == {
+        "version": 2,
+        "entries": {song: "video123"},
+    }
+
+
+def test_corrupt_tracker_is_backed_up_without_overwriting(tmp_path: Path) -> None:
+    tracker_file = tmp_path / "uploads.json"
+    for _ in range(2):
+        tracker_file.write_text("{not json", encoding="utf-8")
+        tracker = UploadTracker(tracker_file)
+        assert not tracker.is_uploaded(tmp_path / "song.mp3")
+
+    backups = sorted(tmp_path.glob("uploads.*.json.bak"))
+    assert len(backups) == 2
+    assert all(backup.read_text(encoding="utf-8") == "{not json" for backup in backups)
+
+
+def test_tracker_file_is_parsed_on_first_use(tmp_path: Path) -> None:
+    tracker_file = tmp_path / "uploads.json"
+    tracker_file.write_text("{not json", encoding="utf-8")
+
+    tracker = UploadTracker(tracker_file)
+    assert tracker_file.read_text(encoding="utf-8") == "{not json"
+
+    assert not tracker.is_uploaded(tmp_path / "song.mp3")
+    assert list(tmp_path.glob("uploads.*.json.bak"))
+
+
+def test_pending_files_returns_media_in_order(tmp_path: Path) -> None:
+    media_files = [
+        MediaFile(path=str(tmp_path / f"song{i}.mp3"), size_bytes=1, mime_type="audio/mpeg") for i in range(4)
+    ]
+    json_tracker = UploadTracker(tmp_path / "uploads.json")
+    json_tracker.mark_uploaded(media_files[1].path, "video-1")
+    assert json_tracker.pending_files(media_files) == [media_files[0], media_files[2], media_files[3]]
+    json_tracker.flush()
+
+    with SQLiteUploadTracker(tmp_path / "uploads.json") as sqlite_tracker:
+        sqlite_tracker.mark_uploaded(media_files[2].path, "video-2")
+        assert sqlite_tracker.pending_files(media_files) == [media_files[0], media_files[3]]
+
+
+def mark_in_subprocess(tracker_file: Path, media_path: Path, autosave: bool) -> None:
+    script = (
+        "import sys\n"
+        "from ytmusic_sync.tracker import UploadTracker\n"
+        "tracker = UploadTracker(sys.argv[1], autosave=sys.argv[3] == 'True')\n"
+        "tracker.mark_uploaded(sys.argv[2], 'video-exit')\n"
+    )
+    project_root = Path(__file__).resolve().parents[2]
+    subprocess.run(
+        [sys.executable, "-c", script, str(tracker_file), str(media_path), str(autosave)],
+        check=True,
+        cwd=project_root,
+    )
+
+
+def test_pending_updates_are_saved_at_exit(tmp_path: Path) -> None:
+    tracker_file = tmp_path / "uploads.json"
+    mark_in_subprocess(tracker_file, tmp_path / "song.mp3", autosave=True)
+
+    assert UploadTracker(tracker_file).get_video_id(tmp_path / "song.mp3") == "video-exit"
+
+
+def test_pending_updates_are_not_saved_at_exit_without_autosave(tmp_path: Path) -> None:
+    tracker_file = tmp_path / "uploads.json"
+    mark_in_subprocess(tracker_file, tmp_path / "song.mp3", autosave=False)
+
+    assert not UploadTracker(tracker_file).is_uploaded(tmp_path / "song.mp3")
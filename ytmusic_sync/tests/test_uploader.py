@@ -0,0 +1,105 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ytmusic_sync.scanner import MediaFile
+from ytmusic_sync.tracker import UploadTracker
+from ytmusic_sync.uploader import AuthenticationError, YouTubeMusicUploader
+
+
+def make_media(tmp_path: Path, count: int) -> list[MediaFile]:
+    return [MediaFile(path=str(tmp_path / f"song{i}.mp3"), size_bytes=1, mime_type="audio/mpeg") for i in range(count)]
+
+
+def test_upload_media_files_uploads_pending_in_parallel(tmp_path: Path) -> None:
+    tracker = UploadTracker(tmp_path / "uploads.json")
+    media_files = make_media(tmp_path, 10)
+    tracker.mark_uploaded(media_files[0].path, "existing")
+
+    uploader = YouTubeMusicUploader(tracker, max_workers=4)
+    lock = threading.Lock()
+    running = peak = 0
+
+    def upload(path: str) -> str:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return "video"
+
+    uploader.upload_file = upload  # type: ignore[method-assign]
+    uploader.upload_media_files(media_files)
+
+    assert 1 < peak <= 4
+    assert tracker.get_video_id(media_files[0].path) == "existing"
+    assert all(tracker.get_video_id(media.path) == "video" for media in media_files[1:])
+
+
+def test_interrupted_upload_run_records_finished_uploads(tmp_path: Path) -> None:
+    tracker = UploadTracker(tmp_path / "uploads.json")
+    media_files = make_media(tmp_path, 40)
+    uploader = YouTubeMusicUploader(tracker, max_workers=2)
+    uploaded: list[str] = []
+
+    def upload(path: str) -> str:
+        time.sleep(0.01)
+        uploaded.append(path)
+        return "video"
+
+    mark_uploaded = tracker.mark_uploaded
+    marks = 0
+
+    def interrupt_third_mark(media_path: str, video_id: str) -> None:
+        nonlocal marks
+        marks += 1
+        if marks == 3:
+            raise KeyboardInterrupt
+        mark_uploaded(media_path, video_id)
+
+    uploader.upload_file = upload  # type: ignore[method-assign]
+    tracker.mark_uploaded = interrupt_third_mark  # type: ignore[method-assign]
+    with pytest.raises(KeyboardInterrupt):
+        uploader.upload_media_files(media_files)
+
+    # No queued uploads run after the interrupt, and every other finished upload is recorded.
+    assert len(uploaded) < len(media_files)
+    assert sum(tracker.is_uploaded(media.path) for media in media_files) == len(uploaded) - 1
+
+
+def test_upload_media_files_propagates_authentication_errors(tmp_path: Path) -> None:
+    tracker = UploadTracker(tmp_path / "uploads.json")
+    uploader = YouTubeMusicUploader(tracker, max_workers=2)
+
+    def fail(path: str) -> str:
+        raise AuthenticationError("bad headers")
+
+    uploader.upload_file = fail  # type: ignore[method-assign]
+    with pytest.raises(AuthenticationError):
+        uploader.upload_media_files(make_media(tmp_path, 5))
+    assert not any(tracker.is_uploaded(media.path) for media in make_media(tmp_path, 5))
+
+
+def test_authentication_error_records_finished_uploads_first(tmp_path: Path) -> None:
+    tracker = UploadTracker(tmp_path / "uploads.json")
+    media_files = make_media(tmp_path, 20)
+    uploader = YouTubeMusicUploader(tracker, max_workers=2)
+    uploaded: list[str] = []
+
+    def upload(path: str) -> str:
+        if path == media_files[3].path:
+            raise AuthenticationError("expired")
+        time.sleep(0.01)
+        uploaded.append(path)
+        return "video"
+
+    uploader.upload_file = upload  # type: ignore[method-assign]
+    with pytest.raises(AuthenticationError):
+        uploader.upload_media_files(media_files)
+
+    assert 3 <= len(uploaded) < len(media_files)
+    assert all(tracker.is_uploaded(path) for path in uploaded)
@@ -2,14 +2,50 @@
 
 from __future__ import annotations
 
-import json
+import atexit
 import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
+
+from . import _jsonutil
+from ._pathutil import path_key
 
 logger = logging.getLogger(__name__)
 
+# Version 1 files were a bare ``{path: {"video_id": ...}}`` mapping; version 2 wraps a
+# flat ``{path: video_id}`` mapping in ``{"version": 2, "entries": ...}``.
+TRACKER_FORMAT_VERSION = 2
+
+
+def _entries_from_document(document: object) -> Dict[str, str]:
+    """Return the ``path -> video id`` entries stored in a tracker *document*.
+
+    Raises
+    ------
+    ValueError
+        If *document* is not a recognised tracker format.
+    """
+
+    if not isinstance(document, dict):
+        raise ValueError("tracker file must contain a JSON object")
+    if "version" in document and "entries" in document:
+        entries = document["entries"]
+        if not isinstance(entries, dict):
+            raise ValueError("tracker entries must be a JSON object")
+        return {path: video_id for path, video_id in entries.items() if isinstance(video_id, str)}
+    return {
+        path: entry["video_id"]
+        for path, entry in document.items()
+        if isinstance(entry, dict) and isinstance(entry.get("video_id"), str)
+    }
+
 
 @dataclass
 class UploadTracker:
@@ -20,16 +56,51 @@ class UploadTracker:
     tracker_file:
         Path to the JSON file storing upload state.
     autosave:
-        If ``True``, the tracker automatically saves whenever an update is made.
+        If ``True``, the tracker automatically saves after updates. Writes are
+        batched: the file is rewritten once *flush_every* updates are pending
+        or *flush_interval* seconds have passed since the last write. Call
+        :meth:`flush` (or use the tracker as a context manager) to persist the
+        remainder.
+    flush_every:
+        Number of unsaved updates that triggers an automatic save.
+    flush_interval:
+        Maximum age in seconds of unsaved updates before an automatic save.
+
+    With *autosave*, updates that are still pending when the interpreter exits
+    normally are saved by an :mod:`atexit` hook. They are lost if the process is killed, so
+    long-running callers should still call :meth:`flush` when a batch ends.
+
+    The tracker file is parsed on first use rather than on construction, so
+    creating a tracker stays cheap even when the file holds many entries.
     """
 
     tracker_file: Path
     autosave: bool = True
-    _state: Dict[str, dict] = field(default_factory=dict, init=False)
+    flush_every: int = 50
+    flush_interval: float = 30.0
+    _state: Dict[str, str] = field(default_factory=dict, init=False)
+    _dirty_count: int = field(default=0, init=False)
+    _last_write: float = field(default=0.0, init=False)
+    _loaded: bool = field(default=False, init=False)
+    # Serialises updates and writes when the tracker is shared between threads.
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        self.tracker_file = Path(self.tracker_file).expanduser().resolve()
-        self._load()
+        self.tracker_file = Path(os.path.realpath(os.path.expanduser(os.fspath(self.tracker_file))))
+        self._last_write = time.monotonic()
+        if not self.tracker_file.exists():
+            self._load()
+            self._loaded = True
+
+    def _entries(self) -> Dict[str, str]:
+        """Return the tracker state, parsing the tracker file on first use."""
+
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load()
+                    self._loaded = True
+        return self._state
 
     def _load(self) -> None:
         if not self.tracker_file.exists():
@@ -38,52 +109,242 @@ class UploadTracker:
             self._write()
             return
         try:
-            with self.tracker_file.open("r", encoding="utf-8") as fp:
-                self._state = json.load(fp)
-        except json.JSONDecodeError as exc:
+            self._state = _entries_from_document(_jsonutil.loads(self.tracker_file.read_bytes()))
+        except ValueError as exc:
+            # Writes are atomic, so this only happens for files damaged outside the tracker.
             logger.error("Failed to parse tracker file %s: %s", self.tracker_file, exc)
-            backup = self.tracker_file.with_suffix(".bak")
+            backup = self._backup_path()
             self.tracker_file.replace(backup)
             logger.warning("Corrupt tracker file renamed to %s", backup)
             self._state = {}
             self._write()
 
+    def _backup_path(self) -> Path:
+        # Timestamped so earlier backups are never overwritten; the random suffix keeps names
+        # unique within a second without probing the filesystem (clock ticks can be ~15 ms on Windows).
+        stamp = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}"
+        return self.tracker_file.with_name(f"{self.tracker_file.stem}.{stamp}{self.tracker_file.suffix}.bak")
+
     def _write(self) -> None:
         self.tracker_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.tracker_file.open("w", encoding="utf-8") as fp:
-            json.dump(self._state, fp, indent=2, sort_keys=True)
+        # Compact, unsorted output: the file is rewritten often and only read back by the tracker.
+        # Write a sibling file, sync it and swap it in, so neither a crash nor a power loss
+        # leaves a half-written tracker.
+        temporary = self.tracker_file.with_name(f"{self.tracker_file.name}.tmp")
+        document = {"version": TRACKER_FORMAT_VERSION, "entries": self._state}
+        try:
+            with open(temporary, "wb") as handle:
+                handle.write(_jsonutil.dumps(document))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temporary, self.tracker_file)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+        self._dirty_count = 0
+        _UNSAVED_TRACKERS.pop(id(self), None)
+        self._last_write = time.monotonic()
 
     def save(self) -> None:
         logger.debug("Saving tracker state to %s", self.tracker_file)
-        self._write()
+        self._entries()
+        with self._lock:
+            self._write()
+
+    def flush(self) -> None:
+        """Save the tracker if it has updates that have not been written yet."""
+
+        if self._dirty_count:
+            self.save()
+
+    def __enter__(self) -> UploadTracker:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
 
     def mark_uploaded(self, media_path: Path | str, video_id: str) -> None:
         """Record that *media_path* was uploaded to YouTube Music."""
 
-        path = str(Path(media_path).resolve())
-        self._state[path] = {"video_id": video_id}
+        path = path_key(media_path)
+        state = self._entries()
+        with self._lock:
+            state[path] = video_id
+            self._dirty_count += 1
+            if self.autosave:
+                _UNSAVED_TRACKERS[id(self)] = self
+            save_now = self.autosave and (
+                self._dirty_count >= self.flush_every
+                or time.monotonic() - self._last_write >= self.flush_interval
+            )
         logger.info("Marked %s as uploaded (video id=%s)", path, video_id)
-        if self.autosave:
+        if save_now:
             self.save()
 
     def is_uploaded(self, media_path: Path | str) -> bool:
-        path = str(Path(media_path).resolve())
-        return path in self._state
+        path = path_key(media_path)
+        return path in self._entries()
+
+    def get_video_id(self, media_path: Path | str) -> Optional[str]:
+        path = path_key(media_path)
+        return self._entries().get(path)
+
+    def _pending(self, media_files: Iterable) -> Dict[str, object]:
+        state = self._entries()
+        keyed = {path_key(media.path): media for media in media_files}
+        # Probe per scanned file: a keys-view difference would iterate the whole tracker state.
+        return {path: media for path, media in keyed.items() if path not in state}
+
+    def pending_files(self, media_files: Iterable) -> List:
+        """Return the entries of *media_files* that have not been uploaded yet, in order."""
+
+        return list(self._pending(media_files).values())
+
+    def pending_items(self, media_files: Iterable) -> Dict[str, dict]:
+        return {path: media.to_dict() for path, media in self._pending(media_files).items()}
+
+
+# Trackers holding unsaved updates, kept alive until they are written so the exit hook can save them.
+_UNSAVED_TRACKERS: Dict[int, UploadTracker] = {}
+
+
+@atexit.register
+def _flush_unsaved_trackers() -> None:
+    for tracker in list(_UNSAVED_TRACKERS.values()):
+        try:
+            tracker.flush()
+        except OSError as exc:
+            logger.error("Failed to save tracker %s at exit: %s", tracker.tracker_file, exc)
+
+
+# Stay below SQLite's historical limit of 999 bound parameters per statement.
+_SQLITE_BATCH_SIZE = 900
+
+
+@dataclass
+class SQLiteUploadTracker:
+    """Persist upload state to a SQLite database.
+
+    Each upload is stored as one row, so recording an upload is a single
+    incremental write rather than a rewrite of the whole tracker, and lookups
+    do not require loading every entry into memory.
+
+    Parameters
+    ----------
+    tracker_file:
+        Path of the JSON tracker file. The database is stored alongside it with a
+        ``.db`` suffix; entries from an existing JSON tracker are imported the
+        first time the database is created.
+    """
+
+    tracker_file: Path
+    database_file: Path = field(init=False)
+    _connection: sqlite3.Connection = field(init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.tracker_file = Path(os.path.realpath(os.path.expanduser(os.fspath(self.tracker_file))))
+        self.database_file = self.tracker_file.with_suffix(".db")
+        self.database_file.parent.mkdir(parents=True, exist_ok=True)
+        # Uploads are recorded from worker threads; every access is serialised by _lock.
+        self._connection = sqlite3.connect(self.database_file, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS uploads (path TEXT PRIMARY KEY, video_id TEXT NOT NULL)"
+        )
+        self._migrate_json()
+
+    def _migrate_json(self) -> None:
+        if not self.tracker_file.exists():
+            return
+        # The emptiness check and the import share one transaction, so an interrupted
+        # import leaves the table empty and is retried on the next run.
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if connection.execute("SELECT 1 FROM uploads LIMIT 1").fetchone():
+                    connection.execute("COMMIT")
+                    return
+                try:
+                    entries = _entries_from_document(_jsonutil.loads(self.tracker_file.read_bytes()))
+                except (OSError, ValueError) as exc:
+                    logger.warning("Unable to import JSON tracker %s: %s", self.tracker_file, exc)
+                    connection.execute("COMMIT")
+                    return
+                connection.executemany("INSERT OR REPLACE INTO uploads VALUES (?, ?)", entries.items())
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        logger.info("Imported %d entries from %s into %s", len(entries), self.tracker_file, self.database_file)
+
+    def save(self) -> None:
+        """No-op; every update is committed as it is made."""
+
+    def flush(self) -> None:
+        """No-op; every update is committed as it is made."""
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> SQLiteUploadTracker:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def mark_uploaded(self, media_path: Path | str, video_id: str) -> None:
+        """Record that *media_path* was uploaded to YouTube Music."""
+
+        path = path_key(media_path)
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO uploads VALUES (?, ?)", (path, video_id))
+        logger.info("Marked %s as uploaded (video id=%s)", path, video_id)
+
+    def is_uploaded(self, media_path: Path | str) -> bool:
+        return self.get_video_id(media_path) is not None
 
     def get_video_id(self, media_path: Path | str) -> Optional[str]:
-        path = str(Path(media_path).resolve())
-        entry = self._state.get(path)
-        if entry:
-            return entry.get("video_id")
-        return None
-
-    def pending_items(self, media_files) -> Dict[str, dict]:
-        pending = {}
-        for media in media_files:
-            path = str(Path(media.path).resolve())
-            if path not in self._state:
-                pending[path] = media.to_dict()
-        return pending
-
-
-__all__ = ["UploadTracker"]
+        path = path_key(media_path)
+        with self._lock:
+            row = self._connection.execute("SELECT video_id FROM uploads WHERE path = ?", (path,)).fetchone()
+        return row[0] if row else None
+
+    def _uploaded_subset(self, paths: List[str]) -> set[str]:
+        uploaded: set[str] = set()
+        with self._lock:
+            for start in range(0, len(paths), _SQLITE_BATCH_SIZE):
+                batch = paths[start : start + _SQLITE_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor = self._connection.execute(f"SELECT path FROM uploads WHERE path IN ({placeholders})", batch)
+                uploaded.update(row[0] for row in cursor)
+        return uploaded
+
+    def _pending(self, media_files: Iterable) -> Dict[str, object]:
+        keyed = {path_key(media.path): media for media in media_files}
+        uploaded = self._uploaded_subset(list(keyed))
+        return {path: media for path, media in keyed.items() if path not in uploaded}
+
+    def pending_files(self, media_files: Iterable) -> List:
+        """Return the entries of *media_files* that have not been uploaded yet, in order."""
+
+        return list(self._pending(media_files).values())
+
+    def pending_items(self, media_files: Iterable) -> Dict[str, dict]:
+        return {path: media.to_dict() for path, media in self._pending(media_files).items()}
+
+
+def open_tracker(tracker_file: Path | str, backend: str = "json") -> UploadTracker | SQLiteUploadTracker:
+    """Create the upload tracker for *backend* (``"json"`` or ``"sqlite"``)."""
+
+    if backend == "json":
+        return UploadTracker(tracker_file)
+    if backend == "sqlite":
+        return SQLiteUploadTracker(tracker_file)
+    raise ValueError(f"Unknown tracker backend: {backend!r}")
+
+
+__all__ = ["SQLiteUploadTracker", "UploadTracker", "open_tracker"]
@@ -3,29 +3,41 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Iterable, Optional
-
-try:
-    from ytmusicapi import YTMusic
-except ImportError:  # pragma: no cover - handled at runtime
-    YTMusic = None  # type: ignore[assignment]
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional
 
 from .scanner import MediaFile
-from .tracker import UploadTracker
+from .tracker import SQLiteUploadTracker, UploadTracker
+
+if TYPE_CHECKING:
+    from ytmusicapi import YTMusic
 
 logger = logging.getLogger(__name__)
 
+# Called once per finished upload with the file, the video id returned by the
+# upload (if any) and the exception it raised (if any).
+ResultCallback = Callable[[MediaFile, Optional[str], Optional[BaseException]], None]
+
 
 class AuthenticationError(RuntimeError):
     """Raised when authentication with YouTube Music fails."""
 
 
-def _load_client(headers_path: Path | str | None) -> YTMusic:
-    if YTMusic is None:  # pragma: no cover - straightforward guard
+def _import_ytmusic() -> type[YTMusic]:
+    # ytmusicapi and its dependencies are slow to import, so defer it until a client is needed.
+    try:
+        from ytmusicapi import YTMusic
+    except ImportError as exc:  # pragma: no cover - straightforward guard
         raise RuntimeError(
             "ytmusicapi is not installed. Install it with 'pip install ytmusicapi' to enable uploads."
-        )
+        ) from exc
+    return YTMusic
+
+
+def _load_client(headers_path: Path | str | None) -> YTMusic:
+    ytmusic_class = _import_ytmusic()
     if headers_path:
         headers_path = Path(headers_path).expanduser()
         if not headers_path.exists():
@@ -36,47 +48,154 @@ def _load_client(headers_path: Path | str | None) -> YTMusic:
             raise AuthenticationError(f"Expected a headers_auth.json file but received directory: {headers_path}")
         logger.info("Authenticating with headers from %s", headers_path)
         try:
-            return YTMusic(headers_path)
+            return ytmusic_class(headers_path)
         except Exception as exc:  # pragma: no cover - ytmusicapi failure at runtime
             raise AuthenticationError(f"Failed to authenticate with headers at {headers_path}: {exc}") from exc
     logger.info("Using default OAuth flow for YTMusic. Provide headers for better stability.")
     try:
-        return YTMusic()
+        return ytmusic_class()
     except Exception as exc:  # pragma: no cover - ytmusicapi failure at runtime
         raise AuthenticationError(f"Failed to authenticate with the default OAuth flow: {exc}") from exc
 
 
 class YouTubeMusicUploader:
-    """High level manager coordinating uploads to YouTube Music."""
+    """High level manager coordinating uploads to YouTube Music.
+
+    Uploads are network bound, so :meth:`upload_media_files` runs up to
+    *max_workers* of them concurrently.
+    """
 
     def __init__(
         self,
-        tracker: UploadTracker,
+        tracker: UploadTracker | SQLiteUploadTracker,
         headers_path: Path | str | None = None,
         dry_run: bool = False,
+        max_workers: int = 4,
     ) -> None:
         self.tracker = tracker
         self.headers_path = headers_path
         self.dry_run = dry_run
+        self.max_workers = max_workers
         self._client: Optional[YTMusic] = None
+        self._client_lock = threading.Lock()
 
     @property
     def client(self) -> YTMusic:
-        if self._client is None:
-            self._client = _load_client(self.headers_path)
-        return self._client
+        return self._get_client()
+
+    def _get_client(self) -> YTMusic:
+        client = self._client
+        if client is not None:
+            return client
+        # Concurrent uploads may all need the client at once; authenticate only once.
+        with self._client_lock:
+            if self._client is None:
+                self._client = _load_client(self.headers_path)
+            return self._client
 
     def upload_media_files(self, media_files: Iterable[MediaFile]) -> None:
-        for media in media_files:
-            if self.tracker.is_uploaded(media.path):
-                logger.info("Skipping %s; already uploaded", media.path)
-                continue
+        media_files = list(media_files)
+        # One bulk tracker query instead of an is_uploaded() probe per file.
+        pending = self.tracker.pending_files(media_files)
+        skipped = len(media_files) - len(pending)
+        if skipped:
+            logger.info("Skipping %d already uploaded files", skipped)
+        if not pending:
+            return
+
+        self.upload_files(pending)
+
+    def upload_files(
+        self,
+        media_files: Iterable[MediaFile],
+        *,
+        stop_event: threading.Event | None = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> int:
+        """Upload *media_files*, recording each successful upload in the tracker.
+
+        At most *max_workers* uploads are submitted at a time, so setting
+        *stop_event* or interrupting the call (e.g. with Ctrl+C) never leaves a
+        backlog of queued uploads behind; uploads already running are allowed
+        to finish and are recorded before the call returns or raises.
+
+        Parameters
+        ----------
+        media_files:
+            Files to upload. They are not checked against the tracker.
+        stop_event:
+            When set, no further uploads are started.
+        on_result:
+            Called on the calling thread once per finished upload.
+
+        Returns
+        -------
+        int
+            Number of uploads that finished, successfully or not.
+
+        Raises
+        ------
+        AuthenticationError
+            If an upload failed to authenticate. No further uploads are started
+            and the ones already running are recorded first.
+        """
+
+        remaining = iter(media_files)
+        in_flight: Dict[Future[Optional[str]], MediaFile] = {}
+        finished = 0
+        auth_error: AuthenticationError | None = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            def submit_next() -> bool:
+                if auth_error is not None or (stop_event is not None and stop_event.is_set()):
+                    return False
+                media = next(remaining, None)
+                if media is None:
+                    return False
+                in_flight[executor.submit(self.upload_file, media.path)] = media
+                return True
+
             try:
-                video_id = self.upload_file(media.path)
-            except AuthenticationError:
+                for _ in range(self.max_workers):
+                    if not submit_next():
+                        break
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        media = in_flight.pop(future)
+                        finished += 1
+                        video_id: Optional[str] = None
+                        error: Optional[BaseException] = None
+                        try:
+                            video_id = future.result()
+                        except AuthenticationError as exc:
+                            auth_error = auth_error or exc
+                            error = exc
+                        except Exception as exc:  # noqa: BLE001 broad except to log errors
+                            logger.exception("Failed to upload %s: %s", media.path, exc)
+                            error = exc
+                        # Results are recorded on this thread, so the tracker is never updated concurrently.
+                        if video_id:
+                            self.tracker.mark_uploaded(media.path, video_id)
+                        if on_result is not None:
+                            on_result(media, video_id, error)
+                        submit_next()
+            except BaseException:
+                # Interrupted: nothing is queued, but record uploads that are still
+                # running once they finish so they are not repeated on the next run.
+                self._record_finished(in_flight)
                 raise
-            except Exception as exc:  # noqa: BLE001 broad except to log errors
-                logger.exception("Failed to upload %s: %s", media.path, exc)
+
+        if auth_error is not None:
+            raise auth_error
+        return finished
+
+    def _record_finished(self, in_flight: Dict[Future[Optional[str]], MediaFile]) -> None:
+        for future, media in in_flight.items():
+            try:
+                video_id = future.result()
+            except Exception:  # noqa: BLE001 - the run is already being aborted
                 continue
             if video_id:
                 self.tracker.mark_uploaded(media.path, video_id)
@@ -87,7 +206,7 @@ class YouTubeMusicUploader:
         if self.dry_run:
             logger.info("Dry run enabled; skipping actual upload for %s", file_path)
             return "dry-run-video-id"
-        response = self.client.upload_song(file_path)
+        response = self._get_client().upload_song(file_path)
         video_id = response.get("videoId") if isinstance(response, dict) else None
         if not video_id:
             logger.warning("Upload of %s completed but no video ID returned", file_path)